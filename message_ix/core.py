@@ -25,6 +25,28 @@ _sh.setLevel(level=logging.WARNING)
 log.addHandler(_sh)
 
 
+def _years_active(duration: pd.DataFrame, yv: int, lt) -> list[int]:
+    """Return periods in which a technology of vintage `yv` and lifetime `lt` is active.
+
+    `duration` is the ``duration_period`` data, sorted by year.
+    """
+    # Cumulative sum for periods including the vintage period
+    age = duration["value"].where(duration["year"] >= yv, 0).cumsum()
+
+    # Return periods:
+    # - the tec's age at the end of the *prior* period is less than or equal to its
+    #   lifetime, and
+    # - at or later than the vintage year.
+    return (
+        duration["year"]
+        .where(age.shift(1, fill_value=0) < lt)
+        .where(duration["year"] >= yv)
+        .dropna()
+        .astype(np.int64)
+        .tolist()
+    )
+
+
 class Scenario(ixmp.Scenario):
     """|MESSAGEix| Scenario.
 
@@ -103,7 +125,15 @@ class Scenario(ixmp.Scenario):
             # might be empty, which fails df.astype() below.
             if data.empty:
                 return data
-            return data.astype({col_name: "int" for _, col_name in year_idx})
+            # Cast only the columns that are not already int, avoiding a copy of the
+            # whole frame when the backend returns them with the right dtype
+            int_ = np.dtype(int)
+            dtypes = {
+                col_name: int_
+                for _, col_name in year_idx
+                if data.dtypes[col_name] != int_
+            }
+            return data.astype(dtypes) if dtypes else data
         elif name == "year":
             # The 'year' set itself
             assert isinstance(data, pd.Series)
@@ -359,8 +389,9 @@ class Scenario(ixmp.Scenario):
             recurse(k, v)
 
         self.add_set("node", nodes)
-        # TODO do we handle levels being added multiple times correctly for ixmp4?
-        self.add_set("lvl_spatial", levels)
+        # Each level appears once per parent that has children at that level; add it
+        # only once
+        self.add_set("lvl_spatial", list(dict.fromkeys(levels)))
         self.add_set("map_spatial_hierarchy", hierarchy)
 
     def add_horizon(
@@ -531,9 +562,10 @@ class Scenario(ixmp.Scenario):
         ----------
         ya_args : tuple, optional
             Either length 2 (`node`, `technology`) or length 3 (`node`, `technology`,
-            `year_vtg`). Supplied directly to :meth:`years_active`. If the third element
-            is omitted, :meth:`years_active` is called repeatedly, once for each vintage
-            for which a technical lifetime value is set (condition (3)).
+            `year_vtg`). The active years for each vintage are those returned by
+            :meth:`years_active`. If the third element is omitted, this is done for each
+            vintage for which a technical lifetime value is set (condition (3)), using
+            ``technical_lifetime`` and ``duration_period`` retrieved once.
         tl_only : bool, optional
             Condition (4), above.
         in_horizon : bool, optional
@@ -597,12 +629,11 @@ class Scenario(ixmp.Scenario):
             )
         else:
             # All possible vintages for the given (node, technology)
-            vintages = sorted(
-                self.par(
-                    "technical_lifetime",
-                    filters={"node_loc": [ya_args[0]], "technology": [ya_args[1]]},
-                )["year_vtg"].unique()
+            lifetime = self.par(
+                "technical_lifetime",
+                filters={"node_loc": [ya_args[0]], "technology": [ya_args[1]]},
             )
+            vintages = sorted(lifetime["year_vtg"].unique())
             ya_max = max(vintages) if tl_only else np.inf
 
             if len(ya_args) == 3:
@@ -612,16 +643,15 @@ class Scenario(ixmp.Scenario):
                     self.years_active(*ya_args),
                 )
             else:
-                # One list of (yv, ya) values for each vintage
-                # NB this could be made more efficient using a modified version of the
-                #    code in years_active(); however any performance penalty from
-                #    repeated calls is probably mitigated by caching.
-                iters = []
-                for yv in vintages:
-                    iters.append(
-                        [(yv, y) for y in self.years_active(ya_args[0], ya_args[1], yv)]
-                    )
-                values = chain(*iters)
+                # One list of (yv, ya) values for each vintage. Same as calling
+                # years_active() for each, but with the lifetime and the duration of
+                # periods retrieved only once
+                lt = dict(zip(lifetime["year_vtg"], lifetime["value"]))
+                duration = self.par("duration_period").sort_values(by="year")
+                values = chain.from_iterable(
+                    [(yv, y) for y in _years_active(duration, int(yv), lt[yv])]
+                    for yv in vintages
+                )
 
         # Minimum value for year_act
         if "in_horizon" in kwargs:
@@ -677,20 +707,8 @@ class Scenario(ixmp.Scenario):
 
         # Duration of periods
         data = self.par("duration_period").sort_values(by="year")
-        # Cumulative sum for periods including the vintage period
-        data["age"] = data.where(data.year >= yv, 0)["value"].cumsum()
-
-        # Return periods:
-        # - the tec's age at the end of the *prior* period is less than or equal to its
-        #   lifetime, and
-        # - at or later than the vintage year.
-        return (
-            data.where(data.age.shift(1, fill_value=0) < lt)
-            .where(data.year >= yv)["year"]
-            .dropna()
-            .astype(np.int64)
-            .tolist()
-        )
+
+        return _years_active(data, yv, lt)
 
     #: Alias for :meth:`years_active`.
     ya = years_active
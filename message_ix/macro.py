@@ -66,10 +66,10 @@ INPUT_DATA = [
 
 def _notna(data, where=None):
     """Raise :class:`RuntimeError` if `data` contains any missing values."""
-    if data.isna().any(axis=None):
+    na = data.isna()
+    if na.any(axis=None):
         raise RuntimeError(
-            f"NaN values in {__name__}.{where}:\n"
-            + data[data.isna().any(axis=1)].to_string()
+            f"NaN values in {__name__}.{where}:\n" + data[na.any(axis=1)].to_string()
         )
     return data
 
@@ -144,8 +144,9 @@ def add_structure(
 
     # Add nodal set structure
     scenario.add_set("type_node", "economy")
-    for n in s.node:
-        scenario.add_set("cat_node", ["economy", n])
+    scenario.add_set(
+        "cat_node", pd.DataFrame({"type_node": "economy", "node": sorted(s.node)})
+    )
 
     # Add sectoral set structure
     scenario.add_set("sector", sorted(s.sector))
@@ -370,7 +371,8 @@ def price(
         else:
             continue
 
-        log.info("\n" + data.to_string())
+        if log.isEnabledFor(logging.INFO):
+            log.info("\n" + data.to_string())
         raise RuntimeError(
             f"{error_message} in MESSAGE variable PRICE_COMMODITY for "
             f"commodity={group_df.commodity.unique()[0]!r}, node={node!r}."
@@ -442,9 +444,10 @@ def validate_transform(
         missing = set(cols) - set(df.columns)
         if missing:
             raise KeyError(f"Missing config data for {missing!r}")
-        for col in cols:
-            if df[col].dropna().empty:
-                raise ValueError(f"Config data for {col!r} is empty")
+        # One mask for all columns; report the first that has no values
+        empty = df[cols].isna().all()
+        if empty.any():
+            raise ValueError(f"Config data for {empty.idxmax()!r} is empty")
         return pd.Series()
 
     # Validate this parameter and retrieve the index columns/dimensions
@@ -572,6 +575,8 @@ def add_model_data(
         Data for calibration.
     """
     c2 = prepare_computer(base, clone, data)
+    # Read the input data once; otherwise a data file is read again for each key below
+    c2.add("data", c2.get("data"))
     for k in "add structure", "add data":
         # print(c2.describe(k))  # For debugging
         c2.get(k)
@@ -1,5 +1,6 @@
 import io
 import os
+from collections import defaultdict
 from collections.abc import Callable, Generator
 from itertools import product
 from pathlib import Path
@@ -236,29 +237,26 @@ def make_austria(  # noqa: C901
 
     name = "demand"
     common.update(level="useful", unit="GWa")
-    for c, base in base_annual_demand.items():
-        scen.add_par(
-            name, make_df(name, **common, commodity=c, value=base * demand_profile)
-        )
+    # Both commodities at once: one row per (commodity, year)
+    n_year = len(year["all"])
+    kw = common | dict(
+        commodity=np.repeat(list(base_annual_demand), n_year),
+        year=np.tile(year["all"], len(base_annual_demand)),
+        value=np.outer(list(base_annual_demand.values()), demand_profile).ravel(),
+    )
+    scen.add_par(name, make_df(name, **kw))
     common.pop("level")
 
+    # Data for each parameter, added with a single call once all are collected
+    par_data: dict[str, list[pd.DataFrame]] = defaultdict(list)
+
     # input, output
     common.update(unit="-")
-    for name, (tec, info) in product(("input", "output"), AUSTRIA_TECH.iterrows()):
-        value = info[f"{name}_value"]
-        if np.isnan(value):
-            continue
-        scen.add_par(
-            name,
-            make_df(
-                name,
-                **common,
-                technology=tec,
-                commodity=info[f"{name}_commodity"],
-                level=info[f"{name}_level"],
-                value=value,
-            ),
-        )
+    for name in ("input", "output"):
+        info = AUSTRIA_TECH.filter(like=f"{name}_").dropna(subset=[f"{name}_value"])
+        for tec, c, level, value in info.itertuples():
+            kw = dict(technology=tec, commodity=c, level=level, value=value)
+            par_data[name].append(make_df(name, **common, **kw))
 
     data = AUSTRIA_PAR.copy()
     # Convert GW·h to GW·a
@@ -268,65 +266,62 @@ def make_austria(  # noqa: C901
     # Convert t / MW·h to t / kw·a
     data["emission_factor"] = data["emission_factor"] * 8760.0 / 1e3
 
-    def _add():
-        """Add using values from the calling scope."""
-        scen.add_par(name, make_df(name, **common, technology=tec, value=value))
+    def _add(value: pd.Series) -> None:
+        """Collect data for `name` with `value` indexed by technology."""
+        base = make_df(name, **common).drop(columns=["technology", "value"])
+        tv = value.rename_axis("technology").rename("value").reset_index()
+        par_data[name].append(tv.merge(base, how="cross")[make_df(name).columns])
 
     name = "capacity_factor"
-    for tec, value in data[name].dropna().items():
-        _add()
+    _add(data[name].dropna())
 
     name = "technical_lifetime"
     common.update(year_vtg=year["all"], unit="y")
-    for tec, value in data[name].dropna().items():
-        _add()
+    _add(data[name].dropna())
 
     name = "growth_activity_up"
     common.update(year_act=year["all"][1:], unit="%")
-    value = 0.05
-    for tec in plants + lights:
-        _add()
+    _add(pd.Series(0.05, index=plants + lights))
 
     name = "initial_activity_up"
     common.update(year_act=year["all"][1:], unit="%")
     value = 0.01 * base_annual_demand["light"] * demand_profile[1:]
     for tec in lights:
-        _add()
+        par_data[name].append(make_df(name, **common, technology=tec, value=value))
 
     # bound_activity_lo, bound_activity_up
     common.update(year_act=year["all"][0], unit="GWa")
-    for (tec, value), kind in product(data["activity"].dropna().items(), ("up", "lo")):
-        name = f"bound_activity_{kind}"
-        _add()
+    for name in ("bound_activity_up", "bound_activity_lo"):
+        _add(data["activity"].dropna())
 
     name = "bound_activity_up"
     common.update(year_act=year["all"][1:])
-    for tec in ("bio_ppl", "hydro_ppl", "import"):
-        value = data.loc[tec, "activity"]
-        _add()
+    _add(data.loc[["bio_ppl", "hydro_ppl", "import"], "activity"])
 
     name = "bound_new_capacity_up"
     common.update(year_vtg=year["all"][0], unit="GW")
-    for tec, value in (data["activity"] / data["capacity_factor"]).dropna().items():
-        _add()
+    _add((data["activity"] / data["capacity_factor"]).dropna())
 
     name = "inv_cost"
     common.update(dict(year_vtg=year["all"], unit="USD/kW"))
-    for tec, value in data[name].dropna().items():
-        _add()
+    _add(data[name].dropna())
 
     # fix_cost, var_cost
     common.update(dict(year_vtg=year["vtg"], year_act=year["act"], unit="USD/kWa"))
     for name in ("fix_cost", "var_cost"):
-        for tec, value in data[name].dropna().items():
-            _add()
+        _add(data[name].dropna())
 
     name = "emission_factor"
     common.update(
         year_vtg=year["vtg"], year_act=year["act"], unit="tCO2/kWa", emission="CO2"
     )
-    for tec, value in data[name].dropna().items():
-        _add()
+    _add(data[name].dropna())
+
+    # Add all data. The only read from `scen` (vintage_and_active_years(), above)
+    # precedes these writes; keep it that way so no read is interleaved with the
+    # pending changes before commit()
+    for name, dfs in par_data.items():
+        scen.add_par(name, pd.concat(dfs, ignore_index=True))
 
     scen.commit("Initial commit for Austria model")
     scen.set_as_default()
@@ -594,7 +589,9 @@ def make_westeros(
     grid_efficiency = 0.9
     coal_fraction = 0.6
 
-    # Parameter data
+    # Parameter data, added with a single call per parameter once all are collected
+    par_data: dict[str, list[pd.DataFrame]] = defaultdict(list)
+
     name = "demand"
     kw = common | dict(commodity="light", level="useful", year=y, unit="GWa")
     # - Create a Series from some GDP indices and NaN for other `model_horizon` periods.
@@ -609,7 +606,7 @@ def make_westeros(
         .round()
         .loc[y]
     )
-    scen.add_par(name, make_df(name, **kw, value=demand.values))
+    par_data[name].append(make_df(name, **kw, value=demand.values))
 
     for name, t, c, L, value in [
         ("input", "bulb", "electricity", "final", 1.0),
@@ -620,41 +617,48 @@ def make_westeros(
         ("output", "wind_ppl", "electricity", "secondary", 1.0),
     ]:
         kw = common | dict(technology=t, commodity=c, level=L, value=value, unit="-")
-        scen.add_par(name, make_df(name, **kw))
+        par_data[name].append(make_df(name, **kw))
 
     name = "capacity_factor"
     capacity_factor = dict(coal_ppl=1.0, wind_ppl=0.36, bulb=1.0, grid=1.0)
+    kw = common | dict(unit="-")
     for t, value in capacity_factor.items():
-        kw = common | dict(technology=t, value=value, unit="-")
-        scen.add_par(name, make_df(name, **kw))
+        par_data[name].append(make_df(name, **kw, technology=t, value=value))
 
     name = "technical_lifetime"
+    kw = common | dict(year_vtg=y, unit="y")
     for t, value in dict(coal_ppl=20, wind_ppl=20, bulb=1, grid=30).items():
-        kw = common | dict(technology=t, year_vtg=y, value=value, unit="y")
-        scen.add_par(name, make_df(name, **kw))
+        par_data[name].append(make_df(name, **kw, technology=t, value=value))
 
     name = "growth_activity_up"
+    kw = common | dict(year_act=y[y0_index:], value=0.1, unit="-")
     for t in "coal_ppl", "wind_ppl":
-        kw = common | dict(year_act=y[y0_index:], technology=t, value=0.1, unit="-")
-        scen.add_par(name, make_df(name, **kw))
+        par_data[name].append(make_df(name, **kw, technology=t))
 
     historic_generation = demand.loc[y[ym1_index]] / grid_efficiency
+    kw = common | dict(year_vtg=y[ym1_index], year_act=y[ym1_index], unit="GWa")
     for t, value in (
         ("coal_ppl", coal_fraction * historic_generation),
         ("wind_ppl", (1 - coal_fraction) * historic_generation),
         ("grid", historic_generation),
     ):
-        kw = common | dict(
-            year_vtg=y[ym1_index], year_act=y[ym1_index], technology=t, unit="GWa"
-        )
         name = "historical_activity"
-        scen.add_par(name, make_df(name, **kw, value=value))
+        par_data[name].append(make_df(name, **kw, technology=t, value=value))
         name = "historical_new_capacity"
-        scen.add_par(name, make_df(name, **kw, value=value / capacity_factor[t] / dp0))
+        par_data[name].append(
+            make_df(name, **kw, technology=t, value=value / capacity_factor[t] / dp0)
+        )
 
     name = "interestrate"
-    scen.add_par(name, make_df(name, year=y, value=0.05, unit="-"))
-
+    par_data[name].append(make_df(name, year=y, value=0.05, unit="-"))
+
+    # Keyword arguments for each cost parameter
+    kw = common | dict(year_vtg=yV, year_act=yA, unit="USD/kWa")
+    cost_kw = dict(
+        inv_cost=common | dict(year_vtg=y[y0_index:], unit="USD/kW"),
+        fix_cost=kw,
+        var_cost=kw,
+    )
     for name, tec, value in [
         ("inv_cost", "coal_ppl", 500),
         ("inv_cost", "wind_ppl", 1500),
@@ -665,12 +669,12 @@ def make_westeros(
         ("fix_cost", "grid", 16),
         ("var_cost", "coal_ppl", 30),
     ]:
-        kw = common | (
-            dict(year_vtg=y[y0_index:], unit="USD/kW")
-            if name == "inv_cost"
-            else dict(year_vtg=yV, year_act=yA, unit="USD/kWa")
+        par_data[name].append(
+            make_df(name, **cost_kw[name], technology=tec, value=value)
         )
-        scen.add_par(name, make_df(name, **kw, technology=tec, value=value))
+
+    for name, dfs in par_data.items():
+        scen.add_par(name, pd.concat(dfs, ignore_index=True))
 
     scen.commit("basic model of Westerosi electrification")
     scen.set_as_default()
@@ -769,13 +773,17 @@ def make_subannual(
 
     scen.add_set("technology", list(tec_dict.keys()))
 
-    # Add "time" and "duration_time" to the model
-    for h, dur, tmp_lvl, parent in time_steps:
-        scen.add_set("time", h)
-        scen.add_set("time", parent)
-        scen.add_set("lvl_temporal", tmp_lvl)
-        scen.add_set("map_temporal_hierarchy", [tmp_lvl, h, parent])
-        scen.add_par("duration_time", [h], dur, "-")
+    # Add "time" and "duration_time" to the model, all time slices at once
+    steps = pd.DataFrame(
+        time_steps, columns=["time", "value", "lvl_temporal", "time_parent"]
+    )
+    time = pd.unique(steps[["time", "time_parent"]].to_numpy().ravel())
+    scen.add_set("time", time.tolist())
+    scen.add_set("lvl_temporal", steps["lvl_temporal"].unique().tolist())
+    scen.add_set(
+        "map_temporal_hierarchy", steps[["lvl_temporal", "time", "time_parent"]]
+    )
+    scen.add_par("duration_time", steps[["time", "value"]].assign(unit="-"))
 
     scen.add_set("time_relative", time_relative)
 
@@ -803,26 +811,30 @@ def make_subannual(
     )
     scen.add_par("demand", df)
 
-    # Add "input" and "output" parameters of technologies
+    # Add "input" and "output" parameters of all technologies, one call for each
     common.update(value=1.0, unit="-")
-    base_output = make_df("output", **common, node_dest="node")
-    base_input = make_df("input", **common, node_origin="node")
-    for tec, times in tec_dict.items():
-        c = com_dict[tec]
-        for h1, h2 in zip(times["time"], times.get("time_dest", [])):
-            scen.add_par(
-                "output",
-                base_output.assign(
-                    technology=tec, commodity=c["output"], time=h1, time_dest=h2
-                ),
-            )
-        for h1, h2 in zip(times["time"], times.get("time_origin", [])):
-            scen.add_par(
-                "input",
-                base_input.assign(
-                    technology=tec, commodity=c["input"], time=h1, time_origin=h2
-                ),
+    for name, node, time_col in (
+        ("output", "node_dest", "time_dest"),
+        ("input", "node_origin", "time_origin"),
+    ):
+        data = pd.DataFrame(
+            [
+                (tec, com_dict[tec][name], h1, h2)
+                for tec, times in tec_dict.items()
+                for h1, h2 in zip(times["time"], times.get(time_col, []))
+            ],
+            columns=["technology", "commodity", "time", time_col],
+        )
+        if len(data):
+            df = make_df(
+                name,
+                **common,
+                **{node: "node", time_col: data[time_col]},
+                technology=data["technology"],
+                commodity=data["commodity"],
+                time=data["time"],
             )
+            scen.add_par(name, df)
 
     # Add capacity related parameters
     for year, tec in product([y], capacity.keys()):
@@ -831,13 +843,17 @@ def make_subannual(
 
     common.pop("value")
 
-    # Add capacity factor and variable cost data, both optional
+    # Add capacity factor and variable cost data, both optional; one call for each
     for name, arg in [("capacity_factor", capacity_factor), ("var_cost", var_cost)]:
-        for tec, data in arg.items():
-            df = make_df(
+        if not arg:
+            continue
+        dfs = [
+            make_df(
                 name, **common, technology=tec, time=data.keys(), value=data.values()
             )
-            scen.add_par(name, df)
+            for tec, data in arg.items()
+        ]
+        scen.add_par(name, pd.concat(dfs, ignore_index=True))
 
     # Add operation factor and an arbitrary relation (optional)
     for name, arg in [("operation_factor", operation_factor)]:
@@ -1,5 +1,6 @@
+from collections.abc import Generator
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import numpy as np
 import pandas as pd
@@ -60,14 +61,30 @@ def assert_dantzig_solution(s: Scenario, lp_method: int) -> None:
     assert_frame_equal(exp, s.var("ACT")[cols])
 
 
+@pytest.fixture(scope="module")
+def _ds(
+    test_mp: Platform, request: pytest.FixtureRequest
+) -> Generator[Scenario, Any, None]:
+    """Module-scoped fixture with a solved instance of the Dantzig model."""
+    yield make_dantzig(test_mp, solve=True, request=request)
+
+
+@pytest.fixture
+def dantzig_solved(
+    request: pytest.FixtureRequest, _ds: Scenario
+) -> Generator[Scenario, Any, None]:
+    """Fresh clone of the Dantzig model."""
+    yield _ds.clone(scenario=request.node.name)
+
+
 def calculate_activity(scen: Scenario, tec="transport_from_seattle") -> pd.Series:
     """Sum ``ACT`` levels for `technology` and `mode` groups; return sums for `tec`."""
     return scen.var("ACT").groupby(["technology", "mode"])["lvl"].sum().loc[tec]
 
 
-def test_b_a_u_1_mode(request: pytest.FixtureRequest, test_mp: Platform) -> None:
+def test_b_a_u_1_mode(dantzig_solved: Scenario) -> None:
     """Test effect of ``bound_activity_up`` on 1 mode of a tech with multiple modes."""
-    s0 = make_dantzig(test_mp, solve=True, request=request)
+    s0 = dantzig_solved
 
     # Constraint value
     exp = 0.5 * calculate_activity(s0).sum()
@@ -179,12 +196,12 @@ def test_b_a_u_all_modes(
         assert_equal(calculate_activity(s0).sum(), calculate_activity(s1).sum())
 
 
-def test_commodity_share_lo(request: pytest.FixtureRequest, test_mp: Platform) -> None:
+def test_commodity_share_lo(dantzig_solved: Scenario) -> None:
     """Test effect of ``share_commodity_lo``."""
     n = "new-york"
     common = COMMON | dict(mode="all", level="consumption", node_share=n, node=n)
 
-    s0 = make_dantzig(test_mp, solve=True, request=request)
+    s0 = dantzig_solved
 
     # data for share bound
     def calc_share(s: Scenario) -> float:
@@ -225,7 +242,7 @@ def test_commodity_share_lo(request: pytest.FixtureRequest, test_mp: Platform) -
     assert s1.var("OBJ")["lvl"] >= s0.var("OBJ")["lvl"]
 
 
-def test_commodity_share_up(request: pytest.FixtureRequest, test_mp: Platform) -> None:
+def test_commodity_share_up(dantzig_solved: Scenario) -> None:
     """Test effect of ``share_commodity_up``.
 
     ``ACT`` variable values from the original solution::
@@ -281,7 +298,7 @@ def test_commodity_share_up(request: pytest.FixtureRequest, test_mp: Platform) -
         s.solve(quiet=True)
 
     # initial data
-    s0 = make_dantzig(test_mp, solve=True, request=request)
+    s0 = dantzig_solved
 
     exp = 0.5
 
@@ -347,15 +364,14 @@ def test_commodity_share_up(request: pytest.FixtureRequest, test_mp: Platform) -
     ),
 )
 def test_share_mode(
-    request: pytest.FixtureRequest,
-    test_mp: Platform,
+    dantzig_solved: Scenario,
     dir: str,
     node: str,
     mode: str,
     exp_value: float,
 ) -> None:
     """Test effect of parameters ``share_mode_{lo,up}``."""
-    s0 = make_dantzig(test_mp, solve=True, request=request)
+    s0 = dantzig_solved
 
     tec = f"transport_from_{node}"
 
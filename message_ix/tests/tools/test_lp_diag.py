@@ -96,6 +96,47 @@ def test_diet(test_data_path: Path) -> None:
     assert lp.gf_seq != -1
 
 
+def test_blank_lines(tmp_path: Path, test_data_path: Path) -> None:
+    """Empty and whitespace-only lines are skipped like comments."""
+
+    # Copy of diet.mps with a blank line after each line
+    lines = test_data_path.joinpath("lp_diag", "diet.mps").read_text().splitlines()
+    file = tmp_path.joinpath("diet_blank.mps")
+    file.write_text("".join(f"{line}\n\n  \n" for line in lines))
+    lp = LPdiag()
+
+    # Read MPS, store the matrix in dataFrame
+    lp.read_mps(file)
+
+    # The matrix is the same as for the original file
+    assert lp.mat.shape == (39, 5)
+    assert len(lp.row_name) == 5
+    assert len(lp.col_name) == 8
+
+
+def test_zero_coefficients(
+    capsys: pytest.CaptureFixture[str], tmp_path: Path, test_data_path: Path
+) -> None:
+    """Zero-valued coefficients are counted, but excluded from the matrix."""
+
+    # Copy of diet.mps with the value of one coefficient set to 0
+    text = test_data_path.joinpath("lp_diag", "diet.mps").read_text()
+    file = tmp_path.joinpath("diet_zero.mps")
+    file.write_text(text.replace("C0001     R0002     10", "C0001     R0002     0"))
+    lp = LPdiag()
+
+    lp.read_mps(file)
+
+    # The zero is counted and reported
+    assert 1 == lp.n_zeros
+    assert "1 coefficients with value 0 are excluded" in capsys.readouterr().out
+
+    # The zero is not part of the matrix, or of the statistics of its magnitudes
+    assert lp.mat.shape == (38, 5)
+    assert not (lp.mat["val"] == 0).any()
+    assert 0 == len(lp.mat.query("row == 1 and col == 0"))
+
+
 def test_jg_korh(test_data_path: Path) -> None:
     """Test reading of jg_korh.mps file
 
@@ -235,6 +276,23 @@ def test_lpdiag_print_statistics(test_data_path: Path) -> None:
     assert lp.mat.shape == (10, 5)
 
 
+def test_lpdiag_print_statistics_empty(
+    capsys: pytest.CaptureFixture[str], test_data_path: Path
+) -> None:
+    """Statistics of a matrix without coefficients are printed without error."""
+
+    lp = LPdiag()
+    lp.read_mps(test_data_path.joinpath("lp_diag", "diet.mps"))
+
+    # Drop all coefficients
+    lp.mat = lp.mat.iloc[:0]
+    capsys.readouterr()
+
+    lp.print_statistics()
+
+    assert "distribution of magnitudes is empty" in capsys.readouterr().out
+
+
 def test_lpdiag_locate_outliers(test_data_path: Path) -> None:
     """Test locating outliers."""
 
@@ -253,3 +311,43 @@ def test_lpdiag_locate_outliers(test_data_path: Path) -> None:
     # The function doesn't return anything, so we can only ...
     # Check that the matrix has the correct shape
     assert lp.mat.shape == (1086, 5)
+
+
+def test_lpdiag_log_ranges(test_data_path: Path) -> None:
+    """Test the count and range of magnitudes in each row/col."""
+
+    # Read in the lotfi.mps file
+    file = test_data_path.joinpath("lp_diag", "lotfi.mps")
+    lp = LPdiag()
+
+    # Read MPS, store the matrix in dataFrame
+    lp.read_mps(file)
+
+    # Ranges are the same as computed by a groupby over rows/cols
+    for by_row, dim in ((True, "row"), (False, "col")):
+        obs = lp._log_ranges(lp.mat, by_row)
+        exp = lp.mat.groupby(dim)["log"].agg(["count", "min", "max"])
+        assert len(exp) == len(obs)
+        for seq_id, values in exp.iterrows():
+            assert tuple(values) == obs[seq_id]
+
+    # Empty data gives empty ranges
+    assert {} == lp._log_ranges(lp.mat.iloc[:0])
+
+
+def test_lpdiag_to_sparse(test_data_path: Path) -> None:
+    """Test the matrix coefficients returned as a sparse matrix."""
+
+    # Read in the diet.mps file
+    file = test_data_path.joinpath("lp_diag", "diet.mps")
+    lp = LPdiag()
+    lp.read_mps(file)
+
+    coo = lp.to_sparse()
+    assert (len(lp.row_name), len(lp.col_name)) == coo.shape
+    assert len(lp.mat) == coo.nnz
+
+    # Each coefficient is at the position given by its row/col seq_id
+    dense = coo.toarray()
+    for row, col, val in lp.mat[["row", "col", "val"]].itertuples(index=False):
+        assert val == dense[row, col]
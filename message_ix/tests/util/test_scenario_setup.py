@@ -0,0 +1,41 @@
+from typing import TYPE_CHECKING, cast
+
+import pandas as pd
+import pytest
+from ixmp import Platform
+from ixmp.testing import min_ixmp4_version
+
+from message_ix import Scenario
+
+if TYPE_CHECKING:
+    from ixmp4 import Run
+
+pytestmark = min_ixmp4_version
+
+
+@pytest.mark.ixmp4
+def test_compose_period_map(test_mp: Platform) -> None:
+    from message_ix.util.scenario_setup import compose_period_map
+
+    scenario = Scenario(mp=test_mp, model="model", scenario="scenario", version="new")
+    run = cast("Run", scenario.platform._backend.index[scenario])
+
+    # A partially existing map: "cumulative" and "2020" each appear in some row, but
+    # not together in the same row
+    run.optimization.indexsets.get(name="year").add(data=["2010", "2020"])
+    run.optimization.indexsets.get(name="type_year").add(data="2020")
+    cat_year = run.optimization.tables.get(name="cat_year")
+    cat_year.add(data={"type_year": ["cumulative", "2020"], "year": ["2010", "2020"]})
+
+    compose_period_map(scenario=scenario)
+
+    # Each missing (type_year, year) pair is added, existing ones are not duplicated
+    exp = {
+        ("cumulative", "2010"),
+        ("2020", "2020"),
+        ("cumulative", "2020"),
+        ("2010", "2010"),
+    }
+    obs = pd.DataFrame(cat_year.data).astype(str)
+    assert exp == set(obs.itertuples(index=False, name=None))
+    assert len(exp) == len(obs)
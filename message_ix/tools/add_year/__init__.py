@@ -12,6 +12,7 @@
 
 # %% I) Importing required packages
 import logging
+from operator import itemgetter
 from typing import Literal, Optional, Union
 
 import numpy as np
@@ -93,11 +94,11 @@ def unit_uniform(df: pd.DataFrame) -> pd.DataFrame:
     """Make units in *df* uniform."""
     column = [x for x in df.columns if x in ["commodity", "emission"]]
     if column:
-        com_list = set(df[column[0]])
-        for com in com_list:
-            df.loc[df[column[0]] == com, "unit"] = df.loc[
-                df[column[0]] == com, "unit"
-            ].mode()[0]
+        # Most frequent unit of each commodity/emission. Counts are sorted by unit
+        # within each group, so ties go to the first unit, as with Series.mode()
+        counts = df.groupby([column[0], "unit"]).size()
+        mode = counts.groupby(level=0).idxmax().map(itemgetter(1))
+        df["unit"] = df[column[0]].map(mode)
     else:
         df["unit"] = df["unit"].mode()[0]
     return df
@@ -159,7 +160,8 @@ def add_year(
         2025, when there is only one value in 2020).
     """
     # III.A) Adding sets and required modifications
-    years_new = sorted([x for x in years_new if str(x) not in set(sc_ref.set("year"))])
+    years_ref = set(sc_ref.set("year"))
+    years_new = sorted([x for x in years_new if str(x) not in years_ref])
     add_year_set(sc_ref, sc_new, years_new, firstyear_new, lastyear_new, baseyear_macro)
     # -------------------------------------------------------------------------
     # III.B)  Adding parameters and calculating the missing values for the
@@ -192,11 +194,11 @@ def add_year(
 
     # List of parameters to be ignored (even not copied to the new
     # scenario)
-    par_ignore = ["duration_period"]
+    par_ignore = {"duration_period"}
     par_list = [x for x in par_list if x not in par_ignore]
 
     if not macro:
-        par_macro = [
+        par_macro = {
             "demand_MESSAGE",
             "price_MESSAGE",
             "cost_MESSAGE",
@@ -216,9 +218,16 @@ def add_year(
             "aeei",
             "aeei_factor",
             "gdp_rate",
-        ]
+        }
         par_list = [x for x in par_list if x not in par_macro]
 
+    # "technical_lifetime" of the new scenario, retrieved once for all parameters
+    # with two year dimensions; those are processed after "technical_lifetime" itself
+    lifetime: Optional[pd.DataFrame] = None
+
+    # Parameters of the new scenario, retrieved once and updated by add_year_par()
+    par_list_new = sc_new.par_list()
+
     cat_year_new: pd.DataFrame = sc_new.set("cat_year")
     firstmodelyear_new = cat_year_new.query("type_year == 'firstmodelyear'")
     firstyr_new: int = (
@@ -228,6 +237,8 @@ def add_year(
     )  # type: ignore
     # assert isinstance(firstyear_new, int)
 
+    # FIXME This likely should be sc_ref.set("cat_year"); as is, firstyr_ref is never
+    #       greater than firstyr_new, so that condition for `extrapol` below is unused
     cat_year_ref: pd.DataFrame = sc_new.set("cat_year")
     firstmodelyear_ref = cat_year_ref.query("type_year == 'firstmodelyear'")
     firstyr_ref: int = (
@@ -250,6 +261,9 @@ def add_year(
 
         year_list = [x for x in sc_ref.idx_sets(parname) if "year" in x]
 
+        if len(year_list) == 2 and lifetime is None:
+            lifetime = sc_new.par("technical_lifetime", {"node_loc": reg_list})
+
         if len(year_list) == 2 or parname in ["land_output"]:
             # The loop over "node" is only for reducing the size of tables
             for node in reg_list:
@@ -265,6 +279,8 @@ def add_year(
                     unit_check,
                     extrapol_neg,
                     bound_ext,
+                    lifetime,
+                    par_list_new,
                 )
         else:
             add_year_par(
@@ -279,6 +295,8 @@ def add_year(
                 unit_check,
                 extrapol_neg,
                 bound_ext,
+                lifetime,
+                par_list_new,
             )
 
     sc_new.set_as_default()
@@ -406,6 +424,8 @@ def add_year_par(
     unit_check: bool = True,
     extrapol_neg: Optional[float] = None,
     bound_extend: bool = True,
+    lifetime: Optional[pd.DataFrame] = None,
+    par_list_new: Optional[list[str]] = None,
 ) -> None:
     """Add new years to parameters.
 
@@ -413,13 +433,17 @@ def add_year_par(
     parameter for additional years is calculated mainly by interpolating and
     extrapolating data from existing years.
 
-    See :meth:`add_year` for parameter descriptions.
+    See :meth:`add_year` for parameter descriptions. If given, `lifetime` is the
+    "technical_lifetime" data of `sc_new`, used instead of retrieving it again. If
+    given, `par_list_new` is the list of parameters of `sc_new`; it is updated in place
+    if `parname` is initialized.
 
     """
     #  V.A) Initialization and checks
-    par_list_new = sc_new.par_list()
+    if par_list_new is None:
+        par_list_new = sc_new.par_list()
     idx_names = sc_ref.idx_names(parname)
-    horizon = sorted([int(x) for x in list(set(sc_ref.set("year")))])
+    horizon = sorted([int(x) for x in sc_ref.set("year").unique()])
     node_col = [x for x in idx_names if x in ["node", "node_loc", "node_rel"]]
     year_list = [
         x for x in idx_names if x in ["year", "year_vtg", "year_act", "year_rel"]
@@ -433,6 +457,7 @@ def add_year_par(
             idx_names=sc_ref.idx_names(parname),
         )
         sc_new.commit("New parameter initiated!")
+        par_list_new.append(parname)
 
     par_old = sc_ref.par(parname, filters={node_col[0]: reg_list} if node_col else None)
     par_new = sc_new.par(parname, filters={node_col[0]: reg_list} if node_col else None)
@@ -525,19 +550,21 @@ def add_year_par(
         # Flagging technologies that have lifetime for adding new timesteps
         yr_list = [int(x) for x in set(sc_new.set("year")) if int(x) > firstyear_new]
         min_step = min(np.diff(sorted(yr_list)))
-        par_tec = sc_new.par("technical_lifetime", {"node_loc": nodes})
+        if lifetime is None:
+            par_tec = sc_new.par("technical_lifetime", {"node_loc": nodes})
+        else:
+            par_tec = lifetime.loc[lifetime["node_loc"].isin(nodes)]
         # Technologies with lifetime bigger than minimum time interval
         par_tec = par_tec.loc[par_tec["value"] > min_step]
         df = par_old.copy()
 
+        # Technologies of the parameter which have such a lifetime
         tec_list = (
             []
             if parname == "relation_activity"
-            else [
-                t
-                for t in (set(df["technology"]))
-                if t in list(set(par_tec["technology"]))
-            ]
+            else df.loc[df["technology"].isin(par_tec["technology"]), "technology"]
+            .unique()
+            .tolist()
         )
 
         df_y = interpolate_2d(
@@ -601,7 +628,7 @@ def interpolate_1d(  # noqa: C901
     horizon_new = sorted(horizon + yrs_new)
     idx = [x for x in df.columns if x not in [year_col, value_col]]
     if not df.empty:
-        df2 = df.pivot_table(index=idx, columns=year_col, values=value_col)
+        df2 = df.groupby(idx + [year_col])[value_col].mean().unstack(year_col)
         df2_int_column_list = [int(column) for column in df2.columns]
 
         # To sort the new years smaller than the first year for
@@ -778,8 +805,8 @@ def interpolate_2d(  # noqa: C901
 
     df_tec = df.loc[df["technology"].isin(tec_list)]
     idx = [x for x in df.columns if x not in [year_col, value_col]]
-    df2 = df.pivot_table(index=idx, columns=year_col, values="value")
-    df2_tec = df_tec.pivot_table(index=idx, columns=year_col, values="value")
+    df2 = df.groupby(idx + [year_col])["value"].mean().unstack(year_col)
+    df2_tec = df_tec.groupby(idx + [year_col])["value"].mean().unstack(year_col)
     df2_int_column_list = [int(column) for column in df2.columns]
 
     # -------------------------------------------------------------------------
@@ -815,7 +842,7 @@ def interpolate_2d(  # noqa: C901
         for yr in sorted(
             [
                 int(x)
-                for x in list(set(df_yrs.reset_index()[year_ref]))
+                for x in df_yrs.index.get_level_values(year_ref).unique()
                 if int(x) < year_next
             ]
         ):
@@ -988,13 +1015,15 @@ def interpolate_2d(  # noqa: C901
             .copy()
             .dropna(how="all")
         )
-        idx_list = list(set(df3.index.get_level_values(year_ref)))
+        # Retrieve the year_ref level and the column masks once, not per year
+        df3_yr_ref = df3.index.get_level_values(year_ref)
+        df3_cols = df3.columns.isin(df_dur.columns)
+        df_dur_cols = df_dur.columns.isin(df3.columns)
+        idx_list = df3_yr_ref.unique()
         for y in sorted([x for x in idx_list if x in df_dur.index]):
-            df3.loc[
-                df3.index.get_level_values(year_ref).isin([y]),
-                df3.columns.isin(df_dur.columns),
-            ] = df_dur.loc[y, df_dur.columns.isin(df3.columns)].values
-        node_column = [x for x in idx if any(y in x for y in ["node", "node_loc"])][0]
+            df3.loc[df3_yr_ref == y, df3_cols] = df_dur.loc[y, df_dur_cols].values
+        # First node dimension; "node_loc" also contains "node"
+        node_column = next(x for x in idx if "node" in x)
         df3 = (
             df3.reset_index()
             .set_index([node_column, "technology", year_ref])
@@ -1011,9 +1040,11 @@ def interpolate_2d(  # noqa: C901
         for i in df3.index:
             df2.loc[i, df3.loc[i, :] >= int(df3.loc[i, "lifetime"])] = np.nan
 
-        # Removing extra values from non-lifetime technologies
+        # Removing extra values from non-lifetime technologies; year_ref is read
+        # directly from the index key instead of slicing df2 for each row
+        i_yr_ref = df2.index.names.index(year_ref)
         for i in [x for x in df2.index if x not in df3.index]:
-            condition = df2.loc[[i]].index.get_level_values(year_ref)[0]
+            condition = i[i_yr_ref]
             df2.loc[i, df2.columns > condition] = np.nan
 
     df_par = pd.melt(
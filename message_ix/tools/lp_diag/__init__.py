@@ -3,11 +3,28 @@
 # Written by Marek Makowski, ECE Program of IIASA, in March 2023.
 
 import math
-from collections import Counter
+from array import array
+from typing import TYPE_CHECKING
 
 import numpy as np
 import pandas as pd
 
+if TYPE_CHECKING:
+    import scipy.sparse
+
+# Lookup tables used while parsing each MPS line; defined once, at import
+ROW_TYPES = frozenset(["N", "E", "G", "L"])  # types of rows
+# items of the below dictionaries indicate bounds to be modified:
+# 1 - low, 2 - upper, 3 - both
+BND_TYPE1 = {"LO": 1, "UP": 2, "FX": 3}  # types of bounds requiring value
+BND_TYPE2 = {"MI": 1, "PL": 2, "FR": 3}  # types of bounds not requiring value
+BND_TYPE3 = {
+    "BV": 0,
+    "LI": 0,
+    "UI": 0,
+    "SC": 0,
+}  # types of bounds legal for int-type vars, not processed yet
+
 
 class LPdiag:
     """Process the MPS-format input file and provide its basic diagnostics.
@@ -32,20 +49,26 @@ class LPdiag:
         self.n_rhs = 0  # number of defined RHS
         self.n_ranges = 0  # number of defined ranges
         self.n_bounds = 0  # number of defined bounds
+        self.n_zeros = 0  # number of zero-valued coeffs., excluded from the matrix
         # if not os.path.exists(self.rep_dir):
         #     os.makedirs(self.rep_dir, mode=0o755)
 
         # dictionaries for searchable names and its indices
         # (searching very-long lists is prohibitively slow)
         self.row_name = {}  # key: row-name, item: its seq_id
-        self.seq_row = {}  # key: row sequence, item: [row-name, lo_bnd, up_bond, type]
         self.col_name = {}  # key: col-name, item: its seq_id
-        self.seq_col = {}  # key: col-sequence, item: [col-name, lo_bnd, up_bond]
-        # tmp space for reading COLUMN section of the MPS
-        self.mat_row = []  # row seq_no of the matrix coef.
-        self.mat_col = []  # col seq_no the matrix coef.
-        self.mat_val = []  # matrix coeff.
+        # attributes of rows/cols; seq_ids are consecutive, thus used as list indices
+        self.seq_row = []  # item [seq_id]: [row-name, lo_bnd, up_bond, type]
+        self.seq_col = []  # item [seq_id]: [col-name, lo_bnd, up_bond]
+        # row-names indexed by seq_id, set by mps_sum() for vectorized lookups
+        self.seq_row_name = np.array([], dtype=object)
+        # tmp space for reading COLUMN section of the MPS; typed arrays avoid one
+        # boxed Python object per coefficient
+        self.mat_row = array("i")  # row seq_no of the matrix coef.
+        self.mat_col = array("i")  # col seq_no the matrix coef.
+        self.mat_val = array("d")  # matrix coeff.
         self.col_curr = ""  # current column (initialized to an illegal empty name)
+        self.col_seq = -1  # seq_id of the current column
         self.gf_seq = (
             -1
         )  # sequence_no of the goal function (objective) row: equal = -1, if undefined
@@ -83,14 +106,15 @@ class LPdiag:
         next_sect = 0  # seq_no of the next (to be processed) MPS-file section
         # last_sect = -1  # last processed section
 
-        # process the MPS file
-        with open(self.fname, "r") as reader:
+        # process the MPS file; MPS files may be very large (GBs), thus read in large
+        # blocks instead of the default (8 kB) buffer
+        with open(self.fname, "r", buffering=16 * 2**20) as reader:
             for n_line, line in enumerate(reader):
-                line = line.rstrip("\n")
                 # print(f'line {line}')
-                if line[0] == "*" or len(line) == 0:  # skip commented and empty lines
-                    continue
+                # split() also drops the trailing newline; no need to strip first
                 words = line.split()
+                if not words or line[0] == "*":  # skip empty and commented lines
+                    continue
                 if line[0] == " ":  # continue reading the current MPS section
                     # columns/matrix (first here because most frequently used)
                     if n_section == 2:
@@ -111,6 +135,7 @@ class LPdiag:
                     #     )
                     else:
                         print(f"MPS record {n_line}, section id {n_section}.")
+                        line = line.rstrip("\n")
                         raise RuntimeError(
                             f"MPS line '{line}' (line {n_line}) misplaced,"
                             f" processing section {sections[n_section]}."
@@ -129,6 +154,7 @@ class LPdiag:
                         )
 
                     # process the head of new section
+                    line = line.rstrip("\n")
                     print(f"Next section found: {line} (line {n_line}).")
                     self.n_lines = n_line
                     # last_sect = n_section
@@ -186,16 +212,29 @@ class LPdiag:
         # (the first N row assumed to be the objective):
         assert self.gf_seq != -1, "objective (goal function) row is undefined."
 
-        # create a df with the matrix coefficients
+        # zero-valued coeffs. have no magnitude; count them, but keep them out of
+        # the matrix, so that they are not reported as values of magnitude 0
+        val = np.asarray(self.mat_val, dtype=np.float64)
+        nonzero = val != 0.0
+        self.n_zeros = len(val) - int(nonzero.sum())
+
+        # create a df with the matrix coefficients from typed arrays (one per
+        # attribute), so that pandas need not infer the dtypes
         self.mat = pd.DataFrame(
-            {"row": self.mat_row, "col": self.mat_col, "val": self.mat_val}
+            {
+                "row": np.asarray(self.mat_row, dtype=np.int32)[nonzero],
+                "col": np.asarray(self.mat_col, dtype=np.int32)[nonzero],
+                "val": val[nonzero],
+            }
         )
-        self.mat["abs_val"] = abs(
-            self.mat["val"]
-        )  # add column with absolute values of coeff.
-        self.mat["log"] = np.log10(self.mat["abs_val"]).astype(
-            int
-        )  # add col with int(log10(coeffs))
+        # add cols with absolute values of coeff. and int(log10(coeffs)); computed
+        # on the raw array. The magnitudes of doubles are within [-324, 308], thus
+        # int16 suffices
+        abs_val = np.abs(self.mat["val"].to_numpy())
+        self.mat["abs_val"] = abs_val
+        self.mat["log"] = np.log10(abs_val).astype(np.int16)
+        # row names are not modified after the ROWS section; gather them once
+        self.seq_row_name = np.array([attr[0] for attr in self.seq_row], dtype=object)
         # print(f'matrix after initialization:\n {self.mat}')
 
         # Finish the MPS processing with the summary of its attributes
@@ -207,6 +246,11 @@ class LPdiag:
             f"LP has: {len(self.row_name)} rows, {len(self.col_name)} cols,"
             f" {len(self.mat)} non-zeros, matrix density = {dens}."
         )
+        if self.n_zeros:
+            print(
+                f"{self.n_zeros} coefficients with value 0 are excluded from the"
+                " matrix and its statistics."
+            )
         print(
             f"Numbers of redefined: RHS = {self.n_rhs}, ranges = {self.n_ranges},"
             f" bounds = {self.n_bounds}."
@@ -215,11 +259,10 @@ class LPdiag:
         # todo: add info on dense rows and cols
 
         # info on the GF row, RHS, ranges, bounds
-        df = self.mat.loc[self.mat["row"] == self.gf_seq][
-            "val"
-        ]  # df with values of the GF coefficients.
+        # values of the GF coefficients; only the val column is selected
+        df = self.mat["val"][self.mat["row"].to_numpy() == self.gf_seq]
         print(
-            f'\nThe GF (objective) row named "{self.seq_row.get(self.gf_seq)[0]}" has'
+            f'\nThe GF (objective) row named "{self.seq_row[self.gf_seq][0]}" has'
             f" {len(df)} elements."
         )
         print(f"Distribution of the GF (objective) values:\n{df.describe()}")
@@ -243,7 +286,6 @@ class LPdiag:
             Sequence number of the current MPS line.
         """
 
-        row_types = ["N", "E", "G", "L"]  # types of rows
         n_words = len(words)
         assert n_words == 2, (
             f"row declaration (line {n_line}) has {n_words} words instead of 2."
@@ -251,7 +293,7 @@ class LPdiag:
         row_type = words[0]
         row_name = words[1]
         row_seq = len(self.row_name)
-        assert row_type in row_types, f"unknown row type {row_type} (line {n_line})."
+        assert row_type in ROW_TYPES, f"unknown row type {row_type} (line {n_line})."
         assert row_name not in self.row_name, (
             f"duplicated row name: {row_name} (line {n_line})."
         )
@@ -285,21 +327,22 @@ class LPdiag:
         #     f"processing line no {n_line}, n_words {n_words}:"
         #     f" {line}"
         # )
-        assert n_words in [
-            3,
-            5,
-        ], f"matrix element (line {n_line}) has {n_words} words."
+        assert n_words == 3 or n_words == 5, (
+            f"matrix element (line {n_line}) has {n_words} words."
+        )
         col_name = words[0]
         if col_name != self.col_curr:  # new column
             assert col_name not in self.col_name, (
                 f"duplicated column name: {col_name} (line {n_line})"
             )
             col_seq = len(self.col_name)
-            self.col_name.update({col_name: col_seq})
-            self.seq_col.update({col_seq: [col_name, 0.0, self.infty]})
+            self.col_name[col_name] = col_seq
+            self.seq_col.append([col_name, 0.0, self.infty])
             self.col_curr = col_name
+            self.col_seq = col_seq
         else:
-            col_seq = self.col_name.get(col_name)
+            # elements of a column are in consecutive lines; reuse its seq_id
+            col_seq = self.col_seq
         row_name = words[1]
         row_seq = self.row_name.get(row_name)
         assert row_seq is not None, f"unknown row name {row_name} (line {n_line})."
@@ -309,8 +352,8 @@ class LPdiag:
             raise ValueError(
                 f"string {words[2]} (line {n_line}) is not a number."
             ) from e
-        # add the matrix element to the lists of: seq_row, seq_col, val
-        # the lists will be converted to self.mat df after all elements
+        # add the matrix element to the arrays of: seq_row, seq_col, val
+        # the arrays will be converted to self.mat df after all elements
         # will be read
         self.mat_row.append(row_seq)
         self.mat_col.append(col_seq)
@@ -328,12 +371,9 @@ class LPdiag:
         #     ignore_index=True
         # )
 
-        # proccess the second matrix element in the same MPS row, if defined
-        if n_words > 3:
-            assert n_words == 5, (
-                f"line {n_line}) has {n_words} words, five words needed for defining "
-                "second element in the same MPS line."
-            )
+        # proccess the second matrix element in the same MPS row, if defined; the
+        # number of words was checked above, thus only 3 or 5 are possible
+        if n_words == 5:
             row_name = words[3]
             row_seq = self.row_name.get(row_name)
             assert row_seq is not None, f"unknown row name {row_name} (line {n_line})."
@@ -398,7 +438,7 @@ class LPdiag:
             raise ValueError(
                 f"RHS value {words[pos_name + 1]} (line {n_line}) is not a number."
             ) from e
-        attr = self.seq_row.get(row_seq)  # [row_name, lo_bnd, up_bnd, row_type]
+        attr = self.seq_row[row_seq]  # [row_name, lo_bnd, up_bnd, row_type]
         row_type = attr[3]
         self.row_att(row_seq, row_name, row_type, "rhs", val)
         self.n_rhs += 1
@@ -414,7 +454,7 @@ class LPdiag:
                 raise ValueError(
                     f"RHS value {words[pos_name + 3]} (line {n_line}) is not a number."
                 ) from e
-            attr = self.seq_row.get(row_seq)  # [row_name, lo_bnd, up_bnd, row_type]
+            attr = self.seq_row[row_seq]  # [row_name, lo_bnd, up_bnd, row_type]
             row_type = attr[3]
             self.row_att(row_seq, row_name, row_type, "rhs", val)
             self.n_rhs += 1
@@ -472,7 +512,7 @@ class LPdiag:
             raise ValueError(
                 f"Range value {words[pos_name + 1]} (line {n_line}) is not a number."
             ) from e
-        attr = self.seq_row.get(row_seq)  # [row_name, lo_bnd, up_bnd, row_type]
+        attr = self.seq_row[row_seq]  # [row_name, lo_bnd, up_bnd, row_type]
         row_type = attr[3]
         self.row_att(row_seq, row_name, row_type, "ranges", val)
         self.n_ranges += 1
@@ -489,7 +529,7 @@ class LPdiag:
                     f"Range value {words[pos_name + 3]} (line {n_line}) is not a "
                     "number."
                 ) from e
-            attr = self.seq_row.get(row_seq)  # [row_name, lo_bnd, up_bnd, row_type]
+            attr = self.seq_row[row_seq]  # [row_name, lo_bnd, up_bnd, row_type]
             row_type = attr[3]
             self.row_att(row_seq, row_name, row_type, "ranges", val)
             self.n_ranges += 1
@@ -508,17 +548,6 @@ class LPdiag:
             Sequence number of the current MPS line.
         """
 
-        # items of the below dictionaries indicate bounds to be modified:
-        # 1 - low, 2 - upper, 3 - both
-        bnd_type1 = {"LO": 1, "UP": 2, "FX": 3}  # types of bounds requiring value
-        bnd_type2 = {"MI": 1, "PL": 2, "FR": 3}  # types of bounds not requiring value
-        bnd_type3 = {
-            "BV": 0,
-            "LI": 0,
-            "UI": 0,
-            "SC": 0,
-        }  # types of bounds legal for int-type vars, not processed yet
-
         n_words = len(words)
 
         # first Bounds record implies bounds id (might be empty)
@@ -554,10 +583,10 @@ class LPdiag:
         assert col_seq is not None, (
             f"unknown BOUNDS col-name {col_name} (line {n_line})."
         )
-        attr = self.seq_col.get(col_seq)  # [col_name, lo_bnd, up_bnd]
+        attr = self.seq_col[col_seq]  # [col_name, lo_bnd, up_bnd]
 
         typ = words[0]
-        if typ in bnd_type1:  # bound-types that require a value
+        if typ in BND_TYPE1:  # bound-types that require a value
             try:
                 val = float(words[pos_name + 1])
             except ValueError as e:
@@ -565,25 +594,24 @@ class LPdiag:
                     f"BOUND value {words[pos_name + 1]} (line {n_line}) is not a "
                     "number."
                 ) from e
-            at_pos = bnd_type1.get(typ)
+            at_pos = BND_TYPE1.get(typ)
             if at_pos == 3:  # set both bounds
                 attr[1] = attr[2] = val
             else:
                 attr[at_pos] = val
-        elif typ in bnd_type2:  # value not needed;
+        elif typ in BND_TYPE2:  # value not needed;
             # therefore it is neither checked nor processed
-            at_pos = bnd_type2.get(typ)
+            at_pos = BND_TYPE2.get(typ)
             if at_pos == 3:  # set both bounds
                 attr[1] = attr[2] = self.infty
             else:
                 attr[at_pos] = self.infty
-        elif typ in bnd_type3:
+        elif typ in BND_TYPE3:
             raise TypeError(
                 f"Bound type {typ} of integer var. (line {n_line}) not processed yet."
             )
         else:
             raise TypeError(f"Unknown bound type {typ} (line {n_line}).")
-        self.seq_col.update({col_seq: attr})  # store the updated col-attributes
         self.n_bounds += 1
 
     def row_att(
@@ -634,10 +662,10 @@ class LPdiag:
         assert row_type in type2bnd, f"undefined row type {row_type=} for {row_name=}."
         if sec_name == "rows":  # initialize row attributes (used in ROW section)
             low_upp = type2bnd[row_type]
-            self.seq_row.update({row_seq: [row_name, low_upp[0], low_upp[1], row_type]})
+            self.seq_row.append([row_name, low_upp[0], low_upp[1], row_type])
             # print(
             #     f"attributes of row {row_name} initialized in section {sec_name} to"
-            #     f"{self.seq_row.get(row_seq)}."
+            #     f"{self.seq_row[row_seq]}."
             # )
         elif sec_name in [
             "rhs",
@@ -646,7 +674,7 @@ class LPdiag:
             if row_type == "N":
                 print(f"{sec_name} value {val} ignored for neutral row {row_name}.")
                 return
-            attr = self.seq_row.get(row_seq)  # [row_name, lo_bnd, up_bnd, row_type]
+            attr = self.seq_row[row_seq]  # [row_name, lo_bnd, up_bnd, row_type]
             if sec_name == "rhs":  # process the RHS value
                 if row_type == "G":  # update lo_bnd
                     attr[1] = val
@@ -664,7 +692,6 @@ class LPdiag:
                         attr[2] = attr[1] + val
                     else:
                         attr[1] = attr[2] - abs(val)
-            self.seq_row.update({row_seq: attr})
             # print(
             #     f"attributes of row {row_name} updated in section {sec_name} to"
             #     f" {attr}."
@@ -694,14 +721,16 @@ class LPdiag:
         print(
             f"\nDistribution of int(log10(abs(values))):\n{self.mat['log'].describe()}"
         )
-        min_logv = self.mat["log"].min()
-        max_logv = self.mat["log"].max()
-
-        # count numbers of coeffs for each order of magnitude of their value
-        distribution_magnitude_counter = Counter(self.mat["log"])
-        distribution_magnitudes = dict(
-            sorted(distribution_magnitude_counter.items())
-        )  # counter (sorted by occurances) --> dict sorted by magnitudes
+        # count numbers of coeffs for each order of magnitude of their value; the
+        # magnitudes are returned sorted, thus also provide the range of values. The
+        # counts are reused for the tails, instead of scanning the matrix again
+        magnitudes, counts = np.unique(self.mat["log"].to_numpy(), return_counts=True)
+        if magnitudes.size == 0:
+            print("\nNo non-zero coefficients; distribution of magnitudes is empty.")
+            return
+        distribution_magnitudes = dict(zip(magnitudes.tolist(), counts.tolist()))
+        min_logv = magnitudes[0]
+        max_logv = magnitudes[-1]
         print(
             "\nDistribution of int(log10(abs(values))) sorted by magnitudes of values:"
         )
@@ -709,8 +738,13 @@ class LPdiag:
             f"range = [{min_logv}, {max_logv}] (magnitudes with zero-occurrences"
             " skipped)."
         )
-        for magn in distribution_magnitudes:
-            print(f"{magn:3d}: {distribution_magnitudes[magn]:7d}")
+        # one write for the whole table, instead of one print() per magnitude
+        print(
+            "\n".join(
+                f"{magn:3d}: {count:7d}"
+                for magn, count in distribution_magnitudes.items()
+            )
+        )
 
         if lo_tail > up_tail:
             print(f"Overlapping distribution tails ({lo_tail}, {up_tail}) reset to 0.")
@@ -728,11 +762,13 @@ class LPdiag:
                 f" {lo_tail}) of the distribution."
             )
             print(f"{self.mat.loc[self.mat['log'] <= lo_tail].describe()}")
-            for val in [*range(min_logv, lo_tail + 1)]:
-                print(
+            print(
+                "\n".join(
                     f"Number of log10(values) == {val}:"
-                    f" {self.mat.loc[self.mat['log'] == val]['log'].count()}"
+                    f" {distribution_magnitudes.get(val, 0)}"
+                    for val in range(min_logv, lo_tail + 1)
                 )
+            )
         # up-tail of the distribution
         if max_logv < up_tail:
             print(
@@ -745,11 +781,13 @@ class LPdiag:
                 f" {up_tail}) of the distribution."
             )
             print(f"{self.mat.loc[self.mat['log'] >= up_tail].describe()}")
-            for val in [*range(up_tail, max_logv + 1)]:
-                print(
+            print(
+                "\n".join(
                     f"Number of log10(values) == {val}:"
-                    f" {self.mat.loc[self.mat['log'] == val]['log'].count()}"
+                    f" {distribution_magnitudes.get(val, 0)}"
+                    for val in range(up_tail, max_logv + 1)
                 )
+            )
 
     def locate_outliers(self, small: bool = True, thresh: int = -7, max_rec: int = 500):
         """Locations of outliers, i.e., elements having small/large coefficient values.
@@ -769,14 +807,16 @@ class LPdiag:
             Maximum number of processed coefficients.
         """
 
+        # select the outliers with a single mask over the raw magnitudes
+        log = self.mat["log"].to_numpy()
         if small:  # sub-matrix composed of only small-value outliers
-            df = self.mat.loc[self.mat["log"] <= thresh]
+            df = self.mat.iloc[np.flatnonzero(log <= thresh)]
             print(
                 f"\nRow-wise locations of {df['log'].count()} outliers (coeff. with"
                 f" values of log10(values) <= {thresh})."
             )
         else:  # large-value outliers
-            df = self.mat.loc[self.mat["log"] >= thresh]
+            df = self.mat.iloc[np.flatnonzero(log >= thresh)]
             print(
                 f"\nRow-wise locations of {df['log'].count()} outliers (coeff. with"
                 f" values of log10(values) >= {thresh})."
@@ -784,40 +824,44 @@ class LPdiag:
         df1 = df.sort_values(
             "row"
         )  # sort the df with outliers ascending seq_id of rows
-        df1.reset_index()
+        # [count, min, max] of magnitudes in each row/col, computed once for all of
+        # them instead of filtering the whole matrix for each outlier
+        row_out_rng = self._log_ranges(df1, True)
+        row_all_rng = self._log_ranges(self.mat, True)
+        col_all_rng = self._log_ranges(self.mat, False)
+        # seq_id and name of rows, and seq_id of cols of all outliers; the names are
+        # gathered at once, instead of being looked up for each coeff.
+        rows = df1["row"].to_numpy()
+        row_names = self.seq_row_name[rows]
+        outliers = zip(
+            rows.tolist(),
+            row_names,
+            df1["col"].tolist(),
+            df1["val"].to_numpy(),
+            df1["log"].to_numpy(),
+        )
         col_out = []  # col_seq of outliers' cols
-        for n_rows, (_, row) in enumerate(df1.iterrows()):
+        for n_rows, (row_seq, row_name, col_seq, val, log_val) in enumerate(outliers):
             assert n_rows < max_rec, (
                 "To process all requested coeffs modify the safety limit assertion."
             )
-            row_seq, row_name = self.get_entity_info(
-                row, True
-            )  # row seq_id and name of the current coeff.
-            col_seq, col_name = self.get_entity_info(
-                row, False
-            )  # col seq_id and name of the current coeff.
             if col_seq not in col_out:
                 col_out.append(col_seq)
             else:
                 print(f"{col_seq = } already in another outlier row.")
             print(
-                f"Coeff. ({row_seq}, {col_seq}): val = {row['val']:.4e}, log(val) ="
-                f" {row['log']:n}"
+                f"Coeff. ({row_seq}, {col_seq}): val = {val:.4e}, log(val) ="
+                f" {log_val:n}"
             )
-            df_row_out = df1.loc[df1["row"] == row_seq]  # df with only outlier elements
-            df_row_all = self.mat.loc[
-                self.mat["row"] == row_seq
-            ]  # df with all elements
-            # print(f'matrix elements in the same row:\n{df_row}')
+            n_out, min_out, max_out = row_out_rng[row_seq]  # only outlier elements
+            n_all, min_all, max_all = row_all_rng[row_seq]  # all elements
             print(
                 f"\tRow {row_name} {self.get_entity_range(row_seq, True)} has"
-                f" {df_row_out['log'].count()} outlier-coeff. of magnitudes in"
-                f" [{df_row_out['log'].min()}, {df_row_out['log'].max()}]"
+                f" {n_out} outlier-coeff. of magnitudes in [{min_out}, {max_out}]"
             )
             print(
                 f"\tRow {row_name} {self.get_entity_range(row_seq, True)} has"
-                f" {df_row_all['log'].count()} (all)-coeff. of magnitudes in"
-                f" [{df_row_all['log'].min()}, {df_row_all['log'].max()}]"
+                f" {n_all} (all)-coeff. of magnitudes in [{min_all}, {max_all}]"
             )
             # a column may include more than 1 outlier;
             # therefore columns with outliers reported below:
@@ -834,15 +878,72 @@ class LPdiag:
         )
         col_out.sort()
         for col_seq in col_out:
-            col_name = self.seq_col.get(col_seq)[0]
-            df_col = self.mat.loc[
-                self.mat["col"] == col_seq
-            ]  # df with elements in the same col
+            col_name = self.seq_col[col_seq][0]
+            n_col, min_col, max_col = col_all_rng[col_seq]  # elements in the same col
             print(
                 f"\tCol {col_name} {self.get_entity_range(col_seq, False)} has"
-                f" {df_col['log'].count()} coeff. of magnitudes in"
-                f" [{df_col['log'].min()}, {df_col['log'].max()}]"
+                f" {n_col} coeff. of magnitudes in [{min_col}, {max_col}]"
+            )
+
+    @staticmethod
+    def _log_ranges(
+        df: pd.DataFrame, by_row: bool = True
+    ) -> dict[int, tuple[int, int, int]]:
+        """Return number and range of magnitudes of coefficients in each row or col.
+
+        The coefficients are sorted by their row (or col) seq_id, so that the count,
+        minimum and maximum of int(log10(abs(coeff))) of all rows (or cols) are
+        obtained with a single reduction over contiguous segments.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            Matrix coefficients, with the same columns as ``mat``.
+        by_row : bool
+            True/False for returning the ranges of rows/cols.
+
+        Returns
+        -------
+        dict
+            key: seq_id of the row/col, item: (count, min, max) of its magnitudes.
+        """
+
+        if len(df) == 0:
+            return {}
+        key = df["row" if by_row else "col"].to_numpy()
+        order = np.argsort(key, kind="stable")
+        key = key[order]
+        log = df["log"].to_numpy()[order]
+        # positions at which a new row/col starts in the sorted coefficients
+        start = np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+        count = np.diff(np.r_[start, len(key)])
+        return dict(
+            zip(
+                key[start].tolist(),
+                zip(
+                    count.tolist(),
+                    np.minimum.reduceat(log, start).tolist(),
+                    np.maximum.reduceat(log, start).tolist(),
+                ),
             )
+        )
+
+    def to_sparse(self) -> "scipy.sparse.coo_matrix":
+        """Return the matrix coefficients as a ``scipy.sparse.coo_matrix``.
+
+        Rows/cols of the returned matrix correspond to the seq_id of rows/cols of the
+        LP; the three dense arrays of ``mat`` are used without converting them to
+        Python objects. Call after :meth:`read_mps`.
+        """
+        from scipy import sparse
+
+        return sparse.coo_matrix(
+            (
+                self.mat["val"].to_numpy(),
+                (self.mat["row"].to_numpy(), self.mat["col"].to_numpy()),
+            ),
+            shape=(len(self.row_name), len(self.col_name)),
+        )
 
     def get_entity_info(
         self, mat_row: pd.Series, by_row: bool = True
@@ -865,10 +966,10 @@ class LPdiag:
             # if seq_row {} not stored, then:
             # names = [k for k, idx in self.row_name.items() if idx == ent_seq]
             ent_seq = int(mat_row["row"])
-            name = self.seq_row.get(ent_seq)[0]
+            name = self.seq_row[ent_seq][0]
         else:
             ent_seq = int(mat_row["col"])
-            name = self.seq_col.get(ent_seq)[0]
+            name = self.seq_col[ent_seq][0]
         return ent_seq, name
 
     def get_entity_range(self, seq_id: int, by_row: bool = True) -> str:
@@ -887,10 +988,10 @@ class LPdiag:
         """
 
         if by_row:
-            attr = self.seq_row.get(seq_id)  # [row_name, lo_bnd, up_bnd, row_type]
+            attr = self.seq_row[seq_id]  # [row_name, lo_bnd, up_bnd, row_type]
             pass
         else:
-            attr = self.seq_col.get(seq_id)  # [col_name, lo_bnd, up_bnd]
+            attr = self.seq_col[seq_id]  # [col_name, lo_bnd, up_bnd]
             pass
         s = []  # strings representing lo/up-bounds
         for pos in [0, 1]:
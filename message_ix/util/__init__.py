@@ -1,10 +1,9 @@
 import copy
 import re
 import warnings
-from collections import ChainMap, defaultdict
 from collections.abc import Mapping
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import pandas as pd
 from ixmp.backend import ItemType
@@ -197,9 +196,8 @@ def make_df(name, **data):
         return _deprecated_make_df(name, **data)
 
     # Get item information
-    try:
-        info = ChainMap(MESSAGE.items, MACRO.items)[name]
-    except KeyError:
+    info = MESSAGE.items.get(name, MACRO.items.get(name))
+    if info is None:
         raise ValueError(f"{repr(name)} is not a MESSAGE or MACRO parameter")
 
     # Index names, if not given explicitly, are the same as the index sets
@@ -208,20 +206,11 @@ def make_df(name, **data):
     # Columns for the resulting data frame
     columns = list(dims) + (["value", "unit"] if info.type == ItemType.PAR else [])
 
-    # Default values for every column
-    data = ChainMap(data, defaultdict(lambda: None))
-
-    # Arguments for pd.DataFrame constructor
-    args = dict(data={})
+    # Arguments for pd.DataFrame constructor. Columns not in `data` are left empty
+    args: dict[str, Any] = dict(data={column: data.get(column) for column in columns})
 
     # Flag if all values in `data` are scalars
-    all_scalar = True
-
-    for column in columns:
-        # Update flag
-        all_scalar &= is_scalar(data[column])
-        # Store data
-        args["data"][column] = data[column]
+    all_scalar = all(map(is_scalar, args["data"].values()))
 
     if all_scalar:
         # All values are scalars, so the constructor requires an index to be
@@ -154,8 +154,15 @@ def _maybe_add_to_table(
     if isinstance(data, dict):
         data = pd.DataFrame(data)
 
-    # Keep only rows that don't already exist
-    new_data = data[~data.isin(table.data).all(axis=1)]
+    # Keep only rows that don't already exist. Compare whole rows, not each column
+    # separately; values may be returned as int or str, so compare as str
+    existing = pd.DataFrame(table.data, columns=data.columns).astype(str)
+    new_data = data[
+        data.astype(str)
+        .merge(existing.drop_duplicates(), how="left", indicator=True)["_merge"]
+        .eq("left_only")
+        .to_numpy()
+    ]
 
     # Add new rows to table data
     table.add(data=new_data)
@@ -250,7 +257,8 @@ def _maybe_add_single_item_to_indexset(
     indexset: "IndexSet", data: Union[float, int, str]
 ) -> None:
     """Add `data` to `indexset` if it is missing."""
-    if data not in list(indexset.data):
+    # NOTE indexset.data is already a list; don't copy it just for the membership test
+    if data not in indexset.data:
         indexset.add(data=data)
 
 
@@ -259,10 +267,10 @@ def _maybe_add_list_to_indexset(
 ) -> None:
     """Add missing parts of `data` to `indexset`."""
     # NOTE missing will always only have one type, but how to tell mypy?
-    # NOTE mypy recognizes missing as set[float | str]. If int indexsets mysteriously
-    # turn to float indexsets, look here
-    if missing := set(data) - set(indexset.data):
-        indexset.add(list(missing))  # type: ignore[arg-type]
+    # NOTE If int indexsets mysteriously turn to float indexsets, look here
+    missing = pd.Index(data).difference(indexset.data, sort=False)
+    if len(missing):
+        indexset.add(missing.tolist())
 
 
 def _maybe_add_to_indexset(
@@ -367,15 +375,22 @@ def compose_period_map(scenario: "Scenario") -> None:
         year.remove(data=years)
         year.add(data=sorted_years)
 
-    # Store years within the model horizon
-    for y in sorted_years:
-        if first_model_year is None or first_model_year <= y:
-            y_str = str(y)
-            _maybe_add_to_indexset(indexset=type_year, data=y_str)
-            _maybe_add_to_table(
-                table=cat_year,
-                data={"type_year": ["cumulative", y_str], "year": [y_str, y_str]},
-            )
+    # Store years within the model horizon. Collect them to check against and add to
+    # the existing data once, instead of once per year
+    horizon = [
+        str(y)
+        for y in sorted_years
+        if first_model_year is None or first_model_year <= y
+    ]
+    if horizon:
+        _maybe_add_to_indexset(indexset=type_year, data=horizon)
+        _maybe_add_to_table(
+            table=cat_year,
+            data={
+                "type_year": [t for y in horizon for t in ("cumulative", y)],
+                "year": [y for y in horizon for _ in range(2)],
+            },
+        )
 
     # Initialize duration_period with this data
     duration_period = run.optimization.parameters.get(name="duration_period")
@@ -416,8 +431,9 @@ def check_existence_of_units(platform: Platform, data: pd.DataFrame) -> None:
     except KeyError:
         unit_column = data["unit"]
 
-    units = unit_column.astype(str).to_list()
-    existing_units = platform.units()
+    # Check each distinct unit once, not once per row of `data`
+    units = unit_column.astype(str).unique()
+    existing_units = set(platform.units())
 
     # As long as this function is called after Scenario.__init__() sets
     # '_units_to_warn_about' for this `platform`, this will always be true
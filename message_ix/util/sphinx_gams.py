@@ -38,24 +38,29 @@ def transcribe_docs(infp, outfp, source_filename):
         ".. note:: This page is generated from inline documentation in ``{}``.\n\n"
     ).format(source_filename)
 
+    # Collect output lines, then write them at once
+    lines = []
+
     for line in infp:
         if line.lstrip().startswith("***"):
             # Located a block divider
             if on:
                 # Just finished a block, add a new line to the output
-                outfp.write("\n")
+                lines.append("\n")
             # Toggle between inside/outside of doc block
             on = not on
             # Write the header notice
             if note:
-                outfp.write(note)
+                lines.append(note)
                 note = None
         elif on:
             # Strip leftmost '* ' from the line
             base = "*".join(line.split("*")[1:])[1:]
             # Get rid of windows carriage return
             base = base.rstrip()
-            outfp.write("{}\n".format(base))
+            lines.append("{}\n".format(base))
+
+    outfp.write("".join(lines))
 
     return on is not None
 